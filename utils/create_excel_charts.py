@@ -1,11 +1,156 @@
 #!/usr/bin/env python3
 import os
-import glob
+import re
 import csv
+import itertools
 import xlsxwriter
-from datetime import datetime
+from xlsxwriter.utility import xl_range_abs, xl_rowcol_to_cell
 import pandas as pd
 import argparse
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+# Number of CSV rows parsed and written at a time
+CSV_CHUNK_ROWS = 10000
+
+# Day zero of Excel's 1900 date system for dates from 1900-03-01 on, used to
+# turn dates into serial numbers
+EXCEL_EPOCH = pd.Timestamp(1899, 12, 30)
+
+# Text that float() would read as a finite number
+NUMERIC_RE = re.compile(r'\s*[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?\s*')
+
+# Format and chart settings that are the same for every CSV, built once at
+# import time. xlsxwriter copies these when applying them, so they're safe to
+# share.
+
+# Cell formats: Data sheet dates, Token Info labels and Exchange Info headers
+DATE_FMT = {'num_format': 'mm/dd/yy'}
+BOLD_FMT = {'bold': True}
+HEADER_BORDER_FMT = {
+    'bold': True,
+    'bottom': 1  # Add bottom border
+}
+
+# Chart title font
+TITLE_FONT = {'size': 14, 'bold': True}
+
+# X-axis (date axis)
+X_AXIS_CFG = {
+    'date_axis': True,
+    'num_format': 'mm/dd/yy',
+    'major_gridlines': {'visible': False},  # No vertical gridlines
+    'line': {'color': 'black', 'width': 1},
+}
+
+# Y-axis
+Y_AXIS_CFG = {
+    'name': 'Volume',
+    'major_gridlines': {'visible': True, 'line': {'color': '#D9D9D9', 'width': 0.75}},
+    'line': {'color': 'black', 'width': 1},
+}
+
+# Series lines for Volume and the 30-Day Average
+VOLUME_LINE = {
+    'color': '#0F3D5E',  # Dark blue
+    'width': 2,
+    'smooth': False
+}
+AVG_LINE = {
+    'color': '#ED7D31',  # Orange
+    'width': 2,
+    'smooth': False
+}
+NO_MARKER = {'type': 'none'}
+
+# Legend, chart size and plot area
+LEGEND_CFG = {'position': 'bottom'}
+CHART_SIZE = {'width': 900, 'height': 500}
+PLOTAREA_CFG = {
+    'border': {'none': True}  # Remove chart border
+}
+
+def add_formats(workbook):
+    # Create the date, Token Info and Exchange Info header formats for a workbook
+    return tuple(workbook.add_format(spec) for spec in (DATE_FMT, BOLD_FMT, HEADER_BORDER_FMT))
+
+def read_csv_chunks(csv_file, skip_rows):
+    # Fallback reader for CSVs pandas can't tokenize, such as rows with more
+    # fields than the rows before them. Yields DataFrames of up to
+    # CSV_CHUNK_ROWS rows like read_csv(chunksize=...), after skipping the
+    # header and the first skip_rows data rows. Short rows are padded and
+    # empty cells become NaN, matching the read_csv path; blank lines are
+    # skipped as read_csv does.
+    with open(csv_file, 'r', newline='') as f:
+        reader = csv.reader(f)
+        next(reader, None)  # Skip the header row
+        rows = itertools.islice((row for row in reader if row), skip_rows, None)
+        while True:
+            chunk = list(itertools.islice(rows, CSV_CHUNK_ROWS))
+            if not chunk:
+                return
+            df = pd.DataFrame(chunk)
+            yield df.mask(df == '')
+
+def write_data_rows(worksheet, df, first_row, date_col, date_format):
+    # Write one chunk of CSV rows to the Data sheet starting at first_row and
+    # return the number of rows written
+    
+    # Pull every column out as plain Python values, typed once per column so
+    # the row loop below doesn't have to inspect individual cells
+    columns = []
+    for col_num in range(len(df.columns)):
+        column = df.iloc[:, col_num]
+        if col_num == date_col:
+            # Parse the whole date column at once; cache=True parses each distinct
+            # date string only once. The dates are then turned straight into Excel
+            # serial day numbers, so the writer doesn't have to convert each
+            # datetime itself. Cells that don't parse keep their raw text.
+            dates = pd.to_datetime(column, format='%Y-%m-%d', errors='coerce', cache=True)
+            values = (dates - EXCEL_EPOCH).dt.days
+            # Excel counts a fictitious 1900-02-29, so dates before 1900-03-01
+            # are one day earlier than the plain difference (as write_datetime does)
+            values = values.where(values >= 61, values - 1)
+            # Only parsed dates get the date format
+            date_cell_formats = [date_format if parsed else None
+                                 for parsed in dates.notna().tolist()]
+        elif (pd.api.types.infer_dtype(column, skipna=True) in ('string', 'mixed')
+              and not column.str.fullmatch(NUMERIC_RE, na=False).any()):
+            # Nothing in the column looks like a number (e.g. Name), so skip
+            # the much slower failed conversion of every cell. The .str
+            # accessor is only used on columns inferred as text.
+            values = column
+        else:
+            # Convert the column in one vectorized pass rather than float()
+            # per cell; cells that aren't numbers come back NaN and keep
+            # their text
+            values = pd.to_numeric(column, errors='coerce')
+        # Cells that didn't convert keep their raw text, and empty cells
+        # (NaN/NaT) become None so write_row skips them. Both are done on the
+        # whole column before a single tolist(), so the row loop only sees
+        # plain Python values.
+        values = values.astype(object).where(values.notna(), column)
+        columns.append(values.where(values.notna(), None).tolist())
+    
+    # Write data rows with proper date handling. This loop runs once per CSV
+    # row, so the worksheet methods are bound once and the date column check
+    # is made outside it.
+    write_row = worksheet.write_row
+    write = worksheet.write
+    rows = enumerate(zip(*columns), first_row)
+    if date_col < len(columns):
+        after_date_col = date_col + 1
+        for (row_num, row), date_cell_format in zip(rows, date_cell_formats):
+            # The cells on either side of the date go through write_row; the
+            # date cell is written on its own with its format, or as plain
+            # text if it didn't parse as a date
+            write_row(row_num, 0, row[:date_col])
+            write(row_num, date_col, row[date_col], date_cell_format)
+            write_row(row_num, after_date_col, row[after_date_col:])
+    else:
+        for row_num, row in rows:
+            write_row(row_num, 0, row)
+    
+    return len(df)
 
 def create_excel_with_chart(csv_file):
     # Use the same basename but with .xlsx extension.
@@ -15,17 +160,15 @@ def create_excel_with_chart(csv_file):
     # Get token name from the CSV filename
     token_name = base_name.split('_')[0]
     
-    # Create a new workbook and add a worksheet for the chart first
-    workbook = xlsxwriter.Workbook(xlsx_file)
+    # Create a new workbook and add a worksheet for the chart first.
+    # constant_memory flushes each row to disk as soon as the next one starts,
+    # so every sheet must be written top to bottom.
+    workbook = xlsxwriter.Workbook(xlsx_file, {'constant_memory': True})
+    date_format, tokeninfo_format, header_format = add_formats(workbook)
 
     # Add Token Info worksheet
     tokeninfo_sheet = workbook.add_worksheet("Token Info")
     
-    # Create formats for headers
-    tokeninfo_format = workbook.add_format({
-        'bold': True
-    })
-    
     # Write headers with formatting
     tokeninfo_sheet.write('A1', 'Ticker', tokeninfo_format)
     tokeninfo_sheet.write('A2', 'Long Name', tokeninfo_format)
@@ -45,49 +188,68 @@ def create_excel_with_chart(csv_file):
     # Add a data worksheet
     worksheet = workbook.add_worksheet("Data")
     
-    # Create a date format for Excel
-    date_format = workbook.add_format({'num_format': 'mm/dd/yy'})
-    
-    # Read the CSV file.
+    # Read the header row straight from the file, so the Data sheet and the
+    # column lookups use the names as written (pandas would rename duplicate
+    # and blank ones)
     with open(csv_file, 'r', newline='') as f:
-        reader = csv.reader(f)
-        data = list(reader)
+        header_reader = csv.reader(f)
+        header_row = next(header_reader, [])
+        header_lines = header_reader.line_num
     
-    # Get the column indices
-    header_row = data[0]
-    try:
-        date_col = header_row.index('Date')
-    except ValueError:
+    # Get the column indices for Date, Volume, and 30DayAvg in one place so the
+    # data and chart code agree on them. A repeated name maps to its first
+    # column.
+    col_idx = {}
+    for i, name in enumerate(header_row):
+        col_idx.setdefault(name, i)
+    if 'Date' not in col_idx:
         print(f"Warning: No 'Date' column found in {csv_file}")
-        # Assume it's the second column (index 1)
-        date_col = 1
+    if not {'Date', 'Volume', '30DayAvg'} <= col_idx.keys():
+        print(f"Warning: Missing expected columns in {csv_file}")
+    # Fall back to the usual positions (second, third and fourth columns)
+    date_col = col_idx.get('Date', 1)
+    volume_col = col_idx.get('Volume', 2)
+    avg30_col = col_idx.get('30DayAvg', 3)
     
     # Write headers to worksheet
-    for col_num, cell in enumerate(data[0]):
-        worksheet.write(0, col_num, cell)
-    
-    # Write data rows with proper date handling
-    for row_num, row in enumerate(data[1:], 1):  # Skip header row
-        for col_num, cell in enumerate(row):
-            if col_num == date_col:
-                # Convert date string to datetime object
-                try:
-                    # Parse yyyy-mm-dd format
-                    date_value = datetime.strptime(cell, '%Y-%m-%d')
-                    # Write as Excel date with formatting
-                    worksheet.write_datetime(row_num, col_num, date_value, date_format)
-                except ValueError:
-                    # If date parsing fails, write as text
-                    worksheet.write(row_num, col_num, cell)
-            else:
-                # Try to convert numerical values
-                try:
-                    # Convert to float if possible
-                    cell_value = float(cell)
-                    worksheet.write_number(row_num, col_num, cell_value)
-                except ValueError:
-                    # Not a number, write as string
-                    worksheet.write(row_num, col_num, cell)
+    worksheet.write_row(0, 0, header_row)
+    
+    # Read the data rows in chunks; each chunk is written out before the next
+    # is parsed, so with constant_memory only one chunk of the CSV is held in
+    # memory at once
+    num_rows = 0  # number of data rows (excluding header)
+    try:
+        with pd.read_csv(
+            csv_file,
+            engine='c',
+            # Let the C tokenizer read the raw bytes straight from the mapped
+            # file rather than through a Python file object
+            memory_map=True,
+            # The header row was already read above
+            header=None,
+            skiprows=header_lines,
+            chunksize=CSV_CHUNK_ROWS,
+            # Keep every cell as text so cells like TRUE or false aren't turned
+            # into booleans; write_data_rows types the numeric columns itself
+            dtype=str,
+            # Only truly empty cells are missing, so text such as NA, NULL or
+            # None (including tickers in the Name column) is kept as written
+            keep_default_na=False,
+            na_values=[''],
+        ) as reader:
+            for df in reader:
+                num_rows += write_data_rows(worksheet, df, num_rows + 1, date_col, date_format)
+    except pd.errors.EmptyDataError:
+        # Header-only (or empty) CSV: there are no data rows to write
+        pass
+    except pd.errors.ParserError as e:
+        # pandas rejects rows with more fields than the rows before them.
+        # Rows already written stay as they are; the rest of the file is read
+        # with csv.reader, which accepts ragged rows.
+        print(f"Warning: {str(e).strip()} in {csv_file}; "
+              "reading the remaining rows with csv.reader")
+        for df in read_csv_chunks(csv_file, num_rows):
+            num_rows += write_data_rows(worksheet, df, num_rows + 1, date_col, date_format)
     
     # Create a line chart.
     chart = workbook.add_chart({'type': 'line'})
@@ -95,82 +257,48 @@ def create_excel_with_chart(csv_file):
     # Set chart title and axis labels
     chart.set_title({
         'name': f'{token_name} Global Trading Volume and Rolling 30-Day Average',
-        'name_font': {'size': 14, 'bold': True}
+        'name_font': TITLE_FONT
     })
     
     # Configure X-axis (date axis)
-    chart.set_x_axis({
-        'date_axis': True,
-        'num_format': 'mm/dd/yy',
-        'major_gridlines': {'visible': False},  # No vertical gridlines
-        'line': {'color': 'black', 'width': 1},
-    })
+    chart.set_x_axis(X_AXIS_CFG)
     
     # Configure Y-axis
-    chart.set_y_axis({
-        'name': 'Volume',
-        'major_gridlines': {'visible': True, 'line': {'color': '#D9D9D9', 'width': 0.75}},
-        'line': {'color': 'black', 'width': 1},
-    })
-    
-    # Assume the first row is header.
-    num_rows = len(data) - 1  # number of data rows (excluding header)
+    chart.set_y_axis(Y_AXIS_CFG)
     
-    # Get the column indices for Date, Volume, and 30DayAvg
-    try:
-        date_col = header_row.index('Date')
-        volume_col = header_row.index('Volume')
-        avg30_col = header_row.index('30DayAvg')
-    except ValueError:
-        print(f"Warning: Missing expected columns in {csv_file}")
-        date_col = 1
-        volume_col = 2
-        avg30_col = 3
-    
-    # Excel column letters
-    date_col_letter = chr(65 + date_col)  # A, B, C, etc.
-    volume_col_letter = chr(65 + volume_col)
-    avg30_col_letter = chr(65 + avg30_col)
+    # Absolute Data sheet references for the chart series; xl_range_abs and
+    # xl_rowcol_to_cell handle columns past Z. The shared date range is built once.
+    categories = f"=Data!{xl_range_abs(1, date_col, num_rows, date_col)}"
     
     # Series for Volume
     chart.add_series({
-        'name': '=Data!${0}$1'.format(volume_col_letter),
-        'categories': '=Data!${0}$2:${0}${1}'.format(date_col_letter, num_rows+1),
-        'values': '=Data!${0}$2:${0}${1}'.format(volume_col_letter, num_rows+1),
-        'line': {
-            'color': '#0F3D5E',  # Dark blue
-            'width': 2,
-            'smooth': False
-        },
-        'marker': {'type': 'none'},
+        'name': f"=Data!{xl_rowcol_to_cell(0, volume_col, row_abs=True, col_abs=True)}",
+        'categories': categories,
+        'values': f"=Data!{xl_range_abs(1, volume_col, num_rows, volume_col)}",
+        'line': VOLUME_LINE,
+        'marker': NO_MARKER,
     })
     
     # Series for 30-Day Average
     chart.add_series({
-        'name': '=Data!${0}$1'.format(avg30_col_letter),
-        'categories': '=Data!${0}$2:${0}${1}'.format(date_col_letter, num_rows+1),
-        'values': '=Data!${0}$2:${0}${1}'.format(avg30_col_letter, num_rows+1),
-        'line': {
-            'color': '#ED7D31',  # Orange
-            'width': 2,
-            'smooth': False
-        },
-        'marker': {'type': 'none'},
+        'name': f"=Data!{xl_rowcol_to_cell(0, avg30_col, row_abs=True, col_abs=True)}",
+        'categories': categories,
+        'values': f"=Data!{xl_range_abs(1, avg30_col, num_rows, avg30_col)}",
+        'line': AVG_LINE,
+        'marker': NO_MARKER,
     })
     
     # Configure legend
-    chart.set_legend({'position': 'bottom'})
+    chart.set_legend(LEGEND_CFG)
     
     # Set chart style
     chart.set_style(2)  # Use a cleaner built-in style
     
     # Make the chart larger
-    chart.set_size({'width': 900, 'height': 500})
+    chart.set_size(CHART_SIZE)
     
     # Remove chart border
-    chart.set_plotarea({
-        'border': {'none': True}
-    })
+    chart.set_plotarea(PLOTAREA_CFG)
     
     # Add the chart to the chartsheet
     chartsheet.set_chart(chart)
@@ -178,12 +306,6 @@ def create_excel_with_chart(csv_file):
     # Add Exchange Info worksheet
     exchange_sheet = workbook.add_worksheet("Exchange Info")
     
-    # Create formats for headers
-    header_format = workbook.add_format({
-        'bold': True,
-        'bottom': 1  # Add bottom border
-    })
-    
     # Write headers with formatting
     exchange_sheet.write('A1', 'Exchange', header_format)
     exchange_sheet.write('B1', 'Type', header_format)
@@ -223,12 +345,22 @@ def main():
     else:
         # Process all CSV files in the directory
         print("Processing all CSV files in directory...")
-        for filename in os.listdir(script_dir):
-            if filename.endswith('.csv'):
-                input_file = os.path.join(script_dir, filename)
-                output_file = os.path.splitext(input_file)[0] + '.xlsx'
-                print(f"Processing: {filename}")
-                create_excel_with_chart(input_file)
+        input_files = [os.path.join(script_dir, filename)
+                       for filename in os.listdir(script_dir) if filename.endswith('.csv')]
+        # Each CSV becomes its own workbook with no shared state, so convert
+        # them in parallel across processes. While one worker is blocked
+        # reading its CSV or flushing its workbook to disk, the others keep
+        # parsing, so file I/O overlaps with CPU work.
+        with ProcessPoolExecutor() as executor:
+            futures = {}
+            for input_file in input_files:
+                print(f"Processing: {os.path.basename(input_file)}")
+                futures[executor.submit(create_excel_with_chart, input_file)] = input_file
+            # Report each workbook as soon as it's written rather than in
+            # directory order
+            for future in as_completed(futures):
+                future.result()
+                output_file = os.path.splitext(futures[future])[0] + '.xlsx'
                 print(f"Created Excel file: {output_file}")
 
 if __name__ == '__main__':